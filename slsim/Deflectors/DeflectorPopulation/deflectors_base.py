@@ -82,9 +82,23 @@ class DeflectorsBase(ABC):
         pass
 
     @abstractmethod
-    def draw_deflector(self):
+    def draw_deflector(self, index=None):
         """
-
+        :param index: index of deflector, if not provided, draw randomly from all deflectors
+        :type index: int or None
         :return: dictionary of complete parameterization of deflector
         """
         pass
+
+    def draw_deflectors(self, num):
+        """Draws several deflectors at random. The random indices of all
+        deflectors are drawn at once.
+
+        :param num: number of deflectors to draw
+        :type num: int
+        :return: list of Deflector instances
+        """
+        if num < 1:
+            return []
+        indices = np.random.randint(0, self.deflector_number(), size=num)
+        return [self.draw_deflector(index=index) for index in indices]
@@ -1,6 +1,8 @@
-from astropy.coordinates import SkyCoord
 import datetime
+from functools import lru_cache
+from multiprocessing import get_context
 import numpy as np
+import scipy.fft
 from lenstronomy.SimulationAPI.sim_api import SimAPI
 from slsim.ImageSimulation import image_quality_lenstronomy
 from slsim.ImageSimulation.image_simulation import (
@@ -11,18 +13,32 @@ from slsim.ImageSimulation.image_simulation import (
 from slsim.Util.param_util import transformmatrix_to_pixelscale, convolved_image
 import os.path
 import pickle
-from stpsf.roman import WFI
-import warnings
-
-try:
-    import galsim
-    from galsim import Image, InterpolatedImage, roman
-except ModuleNotFoundError:
-    warning_msg = (
-        "If you want to simulate images with Roman filters, please install the galsim module.\n"
-        "Note that this module is not supported on Windows"
-    )
-    warnings.warn(warning_msg, category=UserWarning, stacklevel=2)
+
+# galsim (and its roman module) are only imported when the Roman simulation is
+# actually used, see _import_galsim(), as importing them is slow
+galsim = None
+roman = None
+
+
+def _import_galsim():
+    """Imports galsim and galsim.roman on first use and makes them available as
+    module attributes.
+
+    :return: None
+    """
+    global galsim, roman
+    if galsim is None:
+        try:
+            import galsim as _galsim
+            from galsim import roman as _roman
+        except ImportError:
+            raise ImportError(
+                "If you want to simulate images with Roman filters, please install the "
+                "galsim module using 'pip install galsim'.\n"
+                "Note that this module is not supported on Windows"
+            )
+        galsim, roman = _galsim, _roman
+
 
 # NOTE: The galsim module is required, which is not supported on Windows.
 #       Additionally, PSF convolution is very slow since the psf is being generated
@@ -49,9 +65,15 @@ def simulate_roman_image(
     dec=-30,
     date=datetime.datetime(year=2027, month=7, day=7, hour=0, minute=0, second=0),
     psf_directory=None,
+    psf_array=None,
+    quantize=True,
+    fft_convolution=False,
+    precision="double",
     **kwargs,
 ):
-    """Creates an image of a selected lens with noise.
+    """Creates an image of a selected lens with noise. To simulate many images
+    with the same settings, use the RomanImageSimulator class directly, such
+    that the setup is only done once.
 
     :param lens_class: class object containing all information of the lensing system
         (e.g., Lens())
@@ -80,98 +102,417 @@ def simulate_roman_image(
     :param psf_directory: Path to directory containing psf file(s) where the psf can be loaded.
                             Otherwise, the psf will be generated by stpsf which is very slow
     :type psf_directory: string
+    :param psf_array: (optional) oversampled psf kernel to use instead of loading or
+        generating the psf, e.g. to reuse the same psf over many simulated images
+    :type psf_array: 2d numpy array or None
+    :param quantize: whether the image is rounded to integer counts after adding the
+        background. Only applies if add_noise is True.
+    :type quantize: bool
+    :param fft_convolution: if True, the psf convolution is done with a cached fft of
+        the psf kernel instead of galsim, which gives slightly different pixel values,
+        see RomanImageSimulator
+    :type fft_convolution: bool
+    :param precision: floating point precision of the intermediate oversampled image
+        and its convolution, 'double' or 'single', see RomanImageSimulator
+    :type precision: string
     :param kwargs: additional keyword arguments for the bands
     :type kwargs: dict
     :return: simulated image
     :rtype: 2d numpy array
     """
+    simulator = RomanImageSimulator(
+        band=band,
+        num_pix=num_pix,
+        observatory=observatory,
+        oversample=oversample,
+        add_noise=add_noise,
+        with_source=with_source,
+        with_deflector=with_deflector,
+        detector=detector,
+        detector_pos=detector_pos,
+        ra=ra,
+        dec=dec,
+        date=date,
+        psf_directory=psf_directory,
+        psf_array=psf_array,
+        quantize=quantize,
+        fft_convolution=fft_convolution,
+        precision=precision,
+        **kwargs,
+    )
+    return simulator.simulate(lens_class, seed=seed)
 
-    # Perform all operations with an additional 3 pixel buffer on each side
-    # to avoid edge effects, cropped out at the end
-    num_pix += 6
-
-    kwargs_model, kwargs_params = lens_class.lenstronomy_kwargs(band)
 
-    kwargs_single_band = image_quality_lenstronomy.kwargs_single_band(
-        observatory=observatory, band=band, **kwargs
-    )
+class RomanImageSimulator(object):
+    """Class to simulate Roman images of many lenses with the same band, cutout
+    size, psf and pointing.
 
-    _exposure_time = kwargs_single_band["exposure_time"]
+    The psf, the lenstronomy image model and the settings of the
+    exposure are set up once and reused for every simulated image.
+    """
 
-    # Unconvolved image will be drawn at oversampled pixel scale
-    kwargs_single_band["pixel_scale"] /= oversample
-    sim_api = SimAPI(
-        numpix=num_pix * oversample,
-        kwargs_single_band=kwargs_single_band,
-        kwargs_model=kwargs_model,
-    )
-    kwargs_lens_light, kwargs_source, kwargs_ps = sim_api.magnitude2amplitude(
-        kwargs_lens_light_mag=kwargs_params.get("kwargs_lens_light", None),
-        kwargs_source_mag=kwargs_params.get("kwargs_source", None),
-        kwargs_ps_mag=kwargs_params.get("kwargs_ps", None),
-    )
-    kwargs_numerics = {
-        "point_source_supersampling_factor": 1,
-        "supersampling_factor": 1,
-    }
-    image_model = sim_api.image_model_class(kwargs_numerics)
-
-    kwargs_lens = kwargs_params.get("kwargs_lens", None)
-    # Draws the unconvolved image
-    array = _exposure_time * image_model.image(
-        kwargs_lens=kwargs_lens,
-        kwargs_source=kwargs_source,
-        kwargs_lens_light=kwargs_lens_light,
-        kwargs_ps=kwargs_ps,
-        unconvolved=True,
-        source_add=with_source,
-        lens_light_add=with_deflector,
-        point_source_add=True,
-    )
+    def __init__(
+        self,
+        band,
+        num_pix,
+        observatory="Roman",
+        oversample=3,
+        add_noise=True,
+        with_source=True,
+        with_deflector=True,
+        detector=1,
+        detector_pos=(2000, 2000),
+        ra=30,
+        dec=-30,
+        date=datetime.datetime(year=2027, month=7, day=7, hour=0, minute=0, second=0),
+        psf_directory=None,
+        psf_array=None,
+        quantize=True,
+        fft_convolution=False,
+        precision="double",
+        **kwargs,
+    ):
+        """
+        :param band: imaging band
+        :type band: string
+        :param num_pix: number of pixels per axis
+        :type num_pix: integer
+        :param observatory: telescope type to be simulated
+        :type observatory: string
+        :param oversample: Number of times that each pixel's side is subdivided for
+            higher accuracy psf convolution
+        :type oversample: integer
+        :param add_noise: determines whether sky background and detector effects are
+            added or not
+        :type add_noise: bool
+        :param with_source: determines whether source is included in image
+        :type with_source: bool
+        :param with_deflector: determines whether deflector is included in image
+        :type with_deflector: bool
+        :param detector: The specific Roman detector being used to generate the psf
+        :type detector: integer from 1 to 18
+        :param detector_pos: The position of the detector being used to generate the psf
+        :type detector_pos: integer between 4 + num_pix * oversample and
+            4092 - num_pix * oversample
+        :param ra: Coordinate in space used to generate sky background
+        :type ra: float between 15 and 45
+        :param dec: Coordinate in space used to generate sky background
+        :type dec: float between -45 and -15
+        :param date: Date used to generate sky background
+        :type date: datetime.datetime class
+        :param psf_directory: Path to directory containing psf file(s) where the psf
+            can be loaded. Otherwise, the psf will be generated by stpsf which is very
+            slow
+        :type psf_directory: string
+        :param psf_array: (optional) oversampled psf kernel to use instead of loading
+            or generating the psf
+        :type psf_array: 2d numpy array or None
+        :param quantize: whether the image is rounded to integer counts after adding
+            the background. Only applies if add_noise is True.
+        :type quantize: bool
+        :param fft_convolution: if True, the psf convolution is done with a cached
+            fft of the psf kernel on the oversampled grid, followed by binning to
+            the Roman pixel scale. This is a different algorithm than the default
+            galsim convolution, which interpolates the image and integrates over the
+            pixels: it is ~5x faster, but individual pixels differ by up to ~2%. It
+            reproduces the lenstronomy supersampled convolution to float precision.
+            Falls back to the galsim convolution for psf kernels with an even number
+            of pixels, which are not centered on a pixel.
+        :type fft_convolution: bool
+        :param precision: floating point precision of the intermediate oversampled
+            image and its convolution, 'double' or 'single'. The final image is
+            single precision in both cases, as galsim draws into float32 images.
+            'single' halves the memory traffic through the oversampled image and
+            agrees with 'double' to ~1e-5 relative to the peak.
+        :type precision: string
+        :param kwargs: additional keyword arguments for the bands
+        :type kwargs: dict
+        """
+        _import_galsim()
+        self._band = band
+        # Perform all operations with an additional 3 pixel buffer on each side
+        # to avoid edge effects, cropped out at the end. The buffer provides the
+        # flux just outside of the cutout that the psf scatters into the edge
+        # pixels. This is not covered by the zero-padding galsim applies for the
+        # fft convolution, without the buffer the edge pixels are underestimated
+        # by up to ~30-50%.
+        self._num_pix = num_pix + 6
+        self._oversample = oversample
+        self._add_noise = add_noise
+        self._with_source = with_source
+        self._with_deflector = with_deflector
+        self._detector = detector
+        self._ra = ra
+        self._dec = dec
+        self._date = date
+        self._quantize = quantize
+        if precision == "double":
+            self._dtype = np.float64
+        elif precision == "single":
+            self._dtype = np.float32
+        else:
+            raise ValueError(
+                "precision %s not supported, choose between 'double' and 'single'."
+                % precision
+            )
+
+        self._kwargs_single_band = image_quality_lenstronomy.kwargs_single_band(
+            observatory=observatory, band=band, **kwargs
+        )
+        self._exposure_time = self._kwargs_single_band["exposure_time"]
+        # Unconvolved image will be drawn at oversampled pixel scale
+        self._kwargs_single_band["pixel_scale"] /= oversample
+
+        self._galsim_psf = get_psf(
+            band,
+            detector,
+            detector_pos,
+            oversample,
+            psf_directory,
+            psf_array=psf_array,
+        )
 
-    # Converts image to the galsim InterpolatedImage class
-    interp = InterpolatedImage(
-        Image(array, xmin=0, ymin=0),
-        scale=0.11 / oversample,
-        flux=np.sum(array),
-    )
+        # The fft of the psf kernel only depends on the (fixed) size of the oversampled
+        # image, so it is computed once here instead of for every convolution
+        self._psf_k = None
+        psf_kernel = self._galsim_psf.image.array.astype(self._dtype, copy=False)
+        if fft_convolution and all(n % 2 == 1 for n in psf_kernel.shape):
+            num_pix_oversampled = self._num_pix * oversample
+            self._fft_shape = tuple(
+                scipy.fft.next_fast_len(num_pix_oversampled + n - 1, real=True)
+                for n in psf_kernel.shape
+            )
+            self._psf_k = scipy.fft.rfft2(psf_kernel, self._fft_shape)
+            self._psf_center = tuple((n - 1) // 2 for n in psf_kernel.shape)
+
+        # random number generator of the detector effects, seeded from the system and
+        # reseeded for every image simulated with a given seed
+        self._rng = galsim.UniformDeviate()
+
+        # the lenstronomy image model depends on the light and mass profiles of the
+        # lens and is only rebuilt when these change
+        self._kwargs_model = None
+        self._sim_api = None
+        self._image_model = None
+
+    def _set_model(self, kwargs_model):
+        """Sets up the lenstronomy image model for the given model
+        configuration, if it differs from the current one.
+
+        :param kwargs_model: lenstronomy model keyword arguments
+        :type kwargs_model: dict
+        :return: None
+        """
+        if self._kwargs_model is not None and kwargs_model == self._kwargs_model:
+            return
+        self._sim_api = SimAPI(
+            numpix=self._num_pix * self._oversample,
+            kwargs_single_band=self._kwargs_single_band,
+            kwargs_model=kwargs_model,
+        )
+        kwargs_numerics = {
+            "point_source_supersampling_factor": 1,
+            "supersampling_factor": 1,
+        }
+        self._image_model = self._sim_api.image_model_class(kwargs_numerics)
+        self._kwargs_model = kwargs_model
+
+    def simulate(self, lens_class, seed=None):
+        """Creates an image of a selected lens.
+
+        :param lens_class: class object containing all information of
+            the lensing system (e.g., Lens())
+        :param seed: An rng seed used for generating detector effects in
+            galsim. If None, the random number generator of the
+            simulator continues its stream.
+        :type seed: integer or None
+        :return: simulated image
+        :rtype: 2d numpy array
+        """
+        kwargs_model, kwargs_params = lens_class.lenstronomy_kwargs(self._band)
+        self._set_model(kwargs_model)
+
+        kwargs_lens_light, kwargs_source, kwargs_ps = self._sim_api.magnitude2amplitude(
+            kwargs_lens_light_mag=kwargs_params.get("kwargs_lens_light", None),
+            kwargs_source_mag=kwargs_params.get("kwargs_source", None),
+            kwargs_ps_mag=kwargs_params.get("kwargs_ps", None),
+        )
+        kwargs_lens = kwargs_params.get("kwargs_lens", None)
+        # Draws the unconvolved image
+        array = self._image_model.image(
+            kwargs_lens=kwargs_lens,
+            kwargs_source=kwargs_source,
+            kwargs_lens_light=kwargs_lens_light,
+            kwargs_ps=kwargs_ps,
+            unconvolved=True,
+            source_add=self._with_source,
+            lens_light_add=self._with_deflector,
+            point_source_add=True,
+        ).astype(self._dtype, copy=False)
+        array *= self._exposure_time
+
+        if self._psf_k is not None:
+            array = self._convolve_fft(array)
+            image = galsim.ImageF(array, xmin=0, ymin=0, scale=0.11)
+        else:
+            # Converts image to the galsim InterpolatedImage class
+            interp = galsim.InterpolatedImage(
+                galsim.Image(array, xmin=0, ymin=0),
+                scale=0.11 / self._oversample,
+                flux=np.sum(array),
+            )
+
+            # Convolve with the psf
+            convolved = galsim.Convolve(interp, self._galsim_psf)
+
+            # Draw interpolated image at the original (not oversampled) pixel scale
+            im = galsim.ImageF(self._num_pix, self._num_pix, scale=0.11)
+            im.setOrigin(0, 0)
+            image = convolved.drawImage(im)
+
+        if self._add_noise:
+            # Obtain sky background corresponding to certain band and add it to the
+            # image. Requires stpsf data files to use
+            image = add_roman_background(
+                image,
+                self._band,
+                self._detector,
+                self._num_pix,
+                self._exposure_time,
+                self._ra,
+                self._dec,
+                self._date,
+                quantize=self._quantize,
+            )
+
+            # Add detector effects and get the resulting array. Without a seed, the
+            # random stream of the simulator is continued
+            if seed is not None:
+                self._rng.seed(seed)
+            roman.allDetectorEffects(
+                image, prev_exposures=(), rng=self._rng, exptime=self._exposure_time
+            )
+
+        array = image.array
+
+        final_array = array[3:-3, 3:-3]
+        final_array = final_array / self._exposure_time
+        return final_array
+
+    def _convolve_fft(self, array):
+        """Convolves the oversampled image with the psf, using the cached fft
+        of the psf kernel, and bins it to the Roman pixel scale.
+
+        :param array: unconvolved image at the oversampled pixel scale
+        :type array: 2d numpy array
+        :return: convolved image at the Roman pixel scale
+        :rtype: 2d numpy array
+        """
+        num_pix_oversampled = array.shape[0]
+        convolved = scipy.fft.irfft2(
+            scipy.fft.rfft2(array, self._fft_shape) * self._psf_k, self._fft_shape
+        )
+        x_0, y_0 = self._psf_center
+        convolved = convolved[
+            x_0 : x_0 + num_pix_oversampled, y_0 : y_0 + num_pix_oversampled
+        ]
+        return convolved.reshape(
+            self._num_pix, self._oversample, self._num_pix, self._oversample
+        ).sum(axis=(1, 3))
 
-    # Gets psf and convolve
-    galsim_psf = get_psf(band, detector, detector_pos, oversample, psf_directory)
-    convolved = galsim.Convolve(interp, galsim_psf)
 
-    # Draw interpolated image at the original (not oversampled) pixel scale
-    im = galsim.ImageF(num_pix, num_pix, scale=0.11)
-    im.setOrigin(0, 0)
-    image = convolved.drawImage(im)
+def simulate_roman_image_batch(
+    lens_classes, band, num_pix, seeds=None, n_processes=None, **kwargs_simulator
+):
+    """Creates images of many lenses in parallel. Each worker process sets up a
+    single RomanImageSimulator, which is then reused for all the images
+    simulated in that process.
 
-    if add_noise:
-        # Obtain sky background corresponding to certain band and add it to the image
-        # Requires stpsf data files to use
-        image = add_roman_background(
-            image, band, detector, num_pix, _exposure_time, ra, dec, date
+    :param lens_classes: list of class objects containing all
+        information of the lensing systems (e.g., Lens())
+    :type lens_classes: list
+    :param band: imaging band
+    :type band: string
+    :param num_pix: number of pixels per axis
+    :type num_pix: integer
+    :param seeds: (optional) rng seeds used for generating detector
+        effects in galsim, one per lens
+    :type seeds: list of integers or None
+    :param n_processes: number of worker processes. If None, the number
+        of cpus is used.
+    :type n_processes: integer or None
+    :param kwargs_simulator: additional keyword arguments of
+        RomanImageSimulator
+    :type kwargs_simulator: dict
+    :return: simulated images, in the same order as lens_classes
+    :rtype: list of 2d numpy arrays
+    """
+    if seeds is None:
+        seeds = [None] * len(lens_classes)
+    if len(seeds) != len(lens_classes):
+        raise ValueError(
+            "The number of seeds (%s) does not match the number of lenses (%s)."
+            % (len(seeds), len(lens_classes))
         )
+    with get_context("spawn").Pool(
+        n_processes,
+        initializer=_init_simulator_worker,
+        initargs=(band, num_pix, kwargs_simulator),
+    ) as pool:
+        images = pool.starmap(_simulate_worker, zip(lens_classes, seeds))
+    return images
 
-        # Add detector effects and get the resulting array
-        rng = galsim.UniformDeviate(seed)
-        roman.allDetectorEffects(
-            image, prev_exposures=(), rng=rng, exptime=_exposure_time
-        )
 
-    array = image.array
+# RomanImageSimulator of a worker process of simulate_roman_image_batch()
+_WORKER_SIMULATOR = None
+
+
+def _init_simulator_worker(band, num_pix, kwargs_simulator):
+    """Initializer of the worker processes of simulate_roman_image_batch(),
+    sets up the simulator once per process.
+
+    :param band: imaging band
+    :type band: string
+    :param num_pix: number of pixels per axis
+    :type num_pix: integer
+    :param kwargs_simulator: additional keyword arguments of
+        RomanImageSimulator
+    :type kwargs_simulator: dict
+    :return: None
+    """
+    global _WORKER_SIMULATOR
+    _WORKER_SIMULATOR = RomanImageSimulator(
+        band=band, num_pix=num_pix, **kwargs_simulator
+    )
 
-    final_array = array[3:-3, 3:-3]
-    final_array = final_array / _exposure_time
-    return final_array
+
+def _simulate_worker(lens_class, seed):
+    """Simulates a single image with the simulator of the worker process.
+
+    :param lens_class: class object containing all information of the
+        lensing system (e.g., Lens())
+    :param seed: An rng seed used for generating detector effects in
+        galsim
+    :type seed: integer or None
+    :return: simulated image
+    :rtype: 2d numpy array
+    """
+    return _WORKER_SIMULATOR.simulate(lens_class, seed=seed)
 
 
 # The following functions have been copy-pasted from the mejiro repo
 # Credit to Bryce Wedig
 
 
-def get_psf(band, detector, detector_pos, oversample, psf_directory):
+_PSF_CACHE = {}
+
+
+def get_psf(band, detector, detector_pos, oversample, psf_directory, psf_array=None):
     """Obtain galsim psf corresponding to specific band, using stpsf.
 
+    The resulting psf is cached in memory, such that repeated calls with the
+    same settings do not reload or regenerate it.
+
     :param band: The specific band corresponding to the psf
     :type band: string
     :param detector: The specific Roman detector being used to generate the psf
@@ -183,10 +524,23 @@ def get_psf(band, detector, detector_pos, oversample, psf_directory):
     :param psf_directory: Path to directory containing psf file(s) where the psf can be loaded.
                             Otherwise, the psf will be generated by stpsf which is very slow
     :type psf_directory: string
+    :param psf_array: (optional) oversampled psf kernel provided by the user. If given,
+        it is used instead of loading or generating the psf, and is not cached.
+    :type psf_array: 2d numpy array or None
     :return: An image of the psf generated by stpsf
     :rtype: galsim's InterpolatedImage class
     """
+    _import_galsim()
+    oversampled_pixel_scale = 0.11 / oversample
+    if psf_array is not None:
+        psf_image = galsim.Image(psf_array, scale=oversampled_pixel_scale)
+        return galsim.InterpolatedImage(psf_image)
+
     detector = f"SCA{str(detector).zfill(2)}"
+    cache_key = (band, detector, tuple(detector_pos), oversample, psf_directory)
+    if cache_key in _PSF_CACHE:
+        return _PSF_CACHE[cache_key]
+
     # Since generating the stpsf is very slow, it can alternatively be loaded from a pickle file
     # where the psf has been generated ahead of time
     psf_file_name = (
@@ -200,25 +554,72 @@ def get_psf(band, detector, detector_pos, oversample, psf_directory):
         )
 
     if os.path.exists(psf_file_path):
-        with open(psf_file_path, "rb") as psf_file:
-            psf = pickle.load(psf_file)
+        psf_kernel = _load_psf_kernel(psf_file_path)
     else:
+        from stpsf.roman import WFI
+
         wfi = WFI()
         wfi.filter = band.upper()
         wfi.detector = detector
         wfi.detector_position = detector_pos
         psf = wfi.calc_psf(oversample=oversample)
+        psf_kernel = psf[0].data
 
     # import PSF to GalSim
-    oversampled_pixel_scale = 0.11 / oversample
-    psf_image = galsim.Image(psf[0].data, scale=oversampled_pixel_scale)
+    psf_image = galsim.Image(psf_kernel, scale=oversampled_pixel_scale)
+    galsim_psf = galsim.InterpolatedImage(psf_image)
+    _PSF_CACHE[cache_key] = galsim_psf
+    return galsim_psf
 
-    return galsim.InterpolatedImage(psf_image)
 
+def _load_psf_kernel(psf_file_path):
+    """Loads the psf kernel from a pickle file generated by stpsf. On first
+    load, the kernel is also stored as a .npy file next to the pickle file,
+    which is memory-mapped instead of unpickled on subsequent loads.
 
-def add_roman_background(image, band, detector, num_pix, exposure_time, ra, dec, date):
+    :param psf_file_path: path to the pickle file of the psf
+    :type psf_file_path: string
+    :return: oversampled psf kernel
+    :rtype: 2d numpy array
+    """
+    npy_file_path = os.path.splitext(psf_file_path)[0] + ".npy"
+    if os.path.exists(npy_file_path) and os.path.getmtime(
+        npy_file_path
+    ) >= os.path.getmtime(psf_file_path):
+        return np.load(npy_file_path, mmap_mode="r")
+
+    with open(psf_file_path, "rb") as psf_file:
+        psf = pickle.loads(psf_file.read())
+    psf_kernel = psf[0].data
+    # Write to a temporary file first, such that other processes never read a
+    # partially written file
+    tmp_file_path = f"{npy_file_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file_path, "wb") as npy_file:
+            np.save(npy_file, psf_kernel)
+        os.replace(tmp_file_path, npy_file_path)
+    except OSError:
+        # e.g. the psf directory is read-only, the pickle file is then loaded again
+        # next time
+        if os.path.exists(tmp_file_path):
+            os.remove(tmp_file_path)
+    return psf_kernel
+
+
+def add_roman_background(
+    image,
+    band,
+    detector,
+    num_pix,
+    exposure_time,
+    ra,
+    dec,
+    date,
+    quantize=True,
+):
     """Adds a sky and thermal background to image, corresponding to a specific
-    band, detector, date, and coordinate in the sky.
+    band, detector, date, and coordinate in the sky. The image is modified in
+    place.
 
     :param image: image to add the background to
     :type image: galsim Image class
@@ -235,14 +636,56 @@ def add_roman_background(image, band, detector, num_pix, exposure_time, ra, dec,
     :type dec: float between -45 and -15
     :param date: Date used to generate sky background
     :type date: datetime.datetime class
+    :param quantize: whether to round the pixel values of the image with
+        background to integers
+    :type quantize: bool
     :return: image with added background
     :rtype: galsim Image class
     """
-    # Get bandpass object
-    bandpass = get_bandpass(band)
+    background = _get_background_template(
+        band, detector, ra, dec, date, num_pix, exposure_time
+    )
+
+    # Add sky and thermal background. This is done in place on the array of the
+    # image (a writable view), to avoid allocating intermediate galsim images
+    array = image.array
+    np.add(array, background, out=array)
+    if quantize:
+        # same rounding as image.quantize(), but without a temporary array
+        np.rint(array, out=array)
+
+    return image
+
+
+@lru_cache(maxsize=128)
+def _get_background_template(band, detector, ra, dec, date, num_pix, exposure_time):
+    """Draws the sky and thermal background of a detector. It does not depend
+    on the lens, so it is cached such that the sky is only drawn once per
+    configuration when simulating a population of lenses.
+
+    :param band: imaging band
+    :type band: string
+    :param detector: The specific Roman detector
+    :type detector: integer from 1 to 18
+    :param ra: Coordinate in space used to generate sky background
+    :type ra: float between 15 and 45
+    :param dec: Coordinate in space used to generate sky background
+    :type dec: float between -45 and -15
+    :param date: Date used to generate sky background
+    :type date: datetime.datetime class
+    :param num_pix: number of pixels per axis
+    :type num_pix: integer
+    :param exposure_time: exposure time [s]
+    :type exposure_time: float
+    :return: sky plus thermal background [counts/pixel], read-only as it
+        is shared between calls
+    :rtype: 2d numpy array
+    """
+    _import_galsim()
+    # Get bandpass object and thermal background
+    _, bandpass, thermal_background = _get_band_info(band)
     # Get wcs
-    wcs_dict = _get_wcs_dict(ra, dec, date)
-    wcs = wcs_dict[detector]
+    wcs = _get_wcs_for_detector(ra, dec, date, detector)
 
     # Build image
     sky_image = galsim.ImageF(num_pix, num_pix, wcs=wcs)
@@ -254,12 +697,10 @@ def add_roman_background(image, band, detector, num_pix, exposure_time, ra, dec,
     wcs.makeSkyImage(sky_image, sky_level)
 
     # Add thermal background
-    thermal_bkg = roman.thermal_backgrounds[get_bandpass_key(band)] * exposure_time
-
-    image = image + sky_image + thermal_bkg
-    image.quantize()
-
-    return image
+    background = sky_image.array
+    background += thermal_background * exposure_time
+    background.setflags(write=False)
+    return background
 
 
 def get_bandpass(band):
@@ -269,8 +710,63 @@ def get_bandpass(band):
     :return: galsim bandpass object corresponding to specific band
     :rtype: galsim Bandpass class
     """
-    bandpass_key = get_bandpass_key(band)
-    return roman.getBandpasses()[bandpass_key]
+    return _get_band_info(band)[1]
+
+
+_BANDPASSES = None
+
+
+def _get_bandpasses():
+    """Loads the galsim Roman bandpasses once and keeps them in memory, as
+    building them is expensive.
+
+    :return: galsim bandpass objects for all Roman bands
+    :rtype: dictionary, where the keys are the galsim band names
+    """
+    global _BANDPASSES
+    if _BANDPASSES is None:
+        _import_galsim()
+        _BANDPASSES = roman.getBandpasses()
+    return _BANDPASSES
+
+
+# Translation of the Roman bands to the keys used in galsim
+_BANDPASS_KEYS = {
+    "F062": "R062",
+    "F087": "Z087",
+    "F106": "Y106",
+    "F129": "J129",
+    "F158": "H158",
+    "F184": "F184",
+    "F146": "W146",
+    "F213": "K213",
+}
+
+# Per Roman band: galsim band name, bandpass and thermal background. Filled on first
+# use of each band by _get_band_info()
+_BAND_INFO = {}
+
+
+def _get_band_info(band):
+    """Looks up all band dependent quantities needed to simulate the background
+    of a Roman image at once.
+
+    :param band: imaging band
+    :type band: string
+    :return: galsim band name, galsim bandpass object and thermal
+        background [counts/pixel/s]
+    :rtype: tuple
+    """
+    band = band.upper()
+    # filled per band, such that a band missing in galsim does not affect the others
+    if band not in _BAND_INFO:
+        bandpass_key = _BANDPASS_KEYS[band]
+        _BAND_INFO[band] = (
+            bandpass_key,
+            _get_bandpasses()[bandpass_key],
+            roman.thermal_backgrounds[bandpass_key],
+        )
+    return _BAND_INFO[band]
 
 
 def get_bandpass_key(band):
@@ -281,21 +777,10 @@ def get_bandpass_key(band):
     :return: Translated band
     :rtype: string
     """
-    band = band.upper()
-    translate = {
-        "F062": "R062",
-        "F087": "Z087",
-        "F106": "Y106",
-        "F129": "J129",
-        "F158": "H158",
-        "F184": "F184",
-        "F146": "W149",
-        "F213": "K213",
-    }
-    return translate[band]
+    return _BANDPASS_KEYS[band.upper()]
 
 
-def _get_wcs_dict(ra, dec, date):
+def _get_wcs_for_detector(ra, dec, date, detector):
     """
     :param ra: Coordinate in space used to generate sky background
     :type ra: float between 15 and 45
@@ -303,17 +788,32 @@ def _get_wcs_dict(ra, dec, date):
     :type dec: float between -45 and -15
     :param date: Date used to generate sky background
     :type date: datetime.datetime class
-    :return: WCS corresponding to date and coordinate in space
-    :rtype: dictionary, where the keys are the detectors and the
-        values are the WCS corresponding to each detector
+    :param detector: The specific Roman detector
+    :type detector: integer from 1 to 18
+    :return: WCS of the detector corresponding to date and coordinate in space
+    :rtype: galsim GSFitsWCS class
     """
+    return _get_wcs_dict(ra, dec, date)[detector]
+
 
-    skycoord = SkyCoord(ra, dec, frame="icrs", unit="deg")
-    ra_hms, dec_dms = skycoord.to_string("hmsdms").split(" ")
+@lru_cache(maxsize=128)
+def _get_wcs_dict(ra, dec, date):
+    """The WCS of all detectors only depends on the pointing and the date, so
+    the result is cached to avoid recomputing it for every simulated image.
 
-    ra_targ = galsim.Angle.from_hms(ra_hms)
-    dec_targ = galsim.Angle.from_dms(dec_dms)
-    targ_pos = galsim.CelestialCoord(ra=ra_targ, dec=dec_targ)
+    :param ra: Coordinate in space used to generate sky background
+    :type ra: float between 15 and 45
+    :param dec: Coordinate in space used to generate sky background
+    :type dec: float between -45 and -15
+    :param date: Date used to generate sky background
+    :type date: datetime.datetime class
+    :return: WCS corresponding to date and coordinate in space
+    :rtype: dictionary, where the keys are the detectors and the values
+        are the WCS corresponding to each detector
+    """
+    _import_galsim()
+    # ra and dec are ICRS coordinates in degrees, which galsim uses directly
+    targ_pos = galsim.CelestialCoord(ra=ra * galsim.degrees, dec=dec * galsim.degrees)
 
     # NB targ_pos indicates the position to observe at the center of the focal plane array
     return roman.getWCS(world_pos=targ_pos, date=date)
@@ -436,9 +936,8 @@ def lens_image_roman(
             noise_galsim, prev_exposures=(), rng=rng, exptime=_exposure_time
         )
 
-    image_array = image_galsim.array
-    noise_array = noise_galsim.array / _exposure_time
-    final_image = image_array + noise_array
+    final_image = noise_galsim.array / _exposure_time
+    np.add(final_image, image_galsim.array, out=final_image)
     if poisson_noise:
         final_image = image_plus_poisson_noise(
             image=final_image, exposure_time=_exposure_time
@@ -10,6 +10,7 @@ from lenstronomy.LensModel.Solver.lens_equation_solver import (
 from slsim.Util.param_util import (
     ellipticity_slsim_to_lenstronomy,
     image_separation_from_positions,
+    einstein_radius_validity,
 )
 from lenstronomy.LightModel.light_model import LightModel
 from lenstronomy.Util import data_util
@@ -264,16 +265,17 @@ class Lens(LensedSystemBase):
         # times 2 must be greater than or equal to the minimum image separation
         # (min_image_separation) and less than or equal to the maximum image
         # separation (max_image_separation).
-        einstein_radius = self._approximate_einstein_radius(source_index=source_index)
-        if not min_image_separation <= 2 * einstein_radius <= max_image_separation:
-            return False
-
         # Criteria 3: The distance between the lens center and the source position
         # must be less than or equal to the angular Einstein radius
         # of the lensing configuration (times sqrt(2)).
-        source_pos = self.source(source_index).point_source_position
-        center_lens, center_source = (self.deflector_position, source_pos)
-        if np.sum((center_lens - center_source) ** 2) > einstein_radius**2 * 2:
+        einstein_radius = self._approximate_einstein_radius(source_index=source_index)
+        if not einstein_radius_validity(
+            einstein_radius,
+            center_lens=self.deflector_position,
+            center_source=self.source(source_index).point_source_position,
+            min_image_separation=min_image_separation,
+            max_image_separation=max_image_separation,
+        ):
             return False
 
         # Criteria 4: The lensing configuration must produce at least two SL images.
@@ -1399,32 +1401,26 @@ class Lens(LensedSystemBase):
         )
         return lens_model_subhalos_only, kwargs_subhalos
 
-    def lens_to_dataframe(self, index=0, df=None):
-        """Store lens properties to a dataframe. This function assumes the name
-        of other methods in the lens class. Thus, if the name of some method
-        changes, this function will break. Additionally, it assumes that the
-        source lives on one plane.
+    def lens_to_dict(self):
+        """Collects lens properties into a flat dictionary, with the same
+        column names as used in lens_to_dataframe(). This function assumes the
+        name of other methods in the lens class. Thus, if the name of some
+        method changes, this function will break. Additionally, it assumes that
+        the source lives on one plane.
 
-        :param index: index of row that the lens is stored in. Default =
-            0
-        :type index: int
-        :param df: Optional. Stores lens into an existing df if
-            necessary, creates one if not.
-        :return: pandas DataFrame containing deflector/source mass and
-            light properties.
+        :return: dictionary containing deflector/source mass and light
+            properties.
         """
         # TODO: Extend this to work for multiple plane sources
-        lens_index = index
-        if df is None:
-            df = pd.DataFrame()
+        row = {}
         # store lens ID
-        df.loc[lens_index, "ID"] = str(self.generate_id())
+        row["ID"] = str(self.generate_id())
 
         # store mass model parameters
         for i in self.deflector_mass_model_lenstronomy()[1]:
             for key in i.keys():
                 val = i[key]
-                df.loc[lens_index, "deflector_mass_" + key] = (
+                row["deflector_mass_" + key] = (
                     safe_value(val)
                     if isinstance(val, (np.ndarray, np.generic, float))
                     else val
@@ -1434,7 +1430,7 @@ class Lens(LensedSystemBase):
         for i in self.deflector_light_model_lenstronomy("i")[1]:
             for key in i.keys():
                 val = i[key]
-                df.loc[lens_index, "deflector_light_" + key] = safe_value(val)
+                row["deflector_light_" + key] = safe_value(val)
 
         # store source light properties
         for i in self.source_light_model_lenstronomy("i")[1]["kwargs_ps"]:
@@ -1442,22 +1438,16 @@ class Lens(LensedSystemBase):
                 if isinstance(i[key], np.ndarray):
                     for j in range(len(i[key])):
                         v = i[key][j]
-                        df.loc[lens_index, f"point_source_light_{key}_{j}"] = (
-                            safe_value(v)
-                        )
+                        row[f"point_source_light_{key}_{j}"] = safe_value(v)
         # single float values (velocity dispersion, redshifts)
-        df.loc[lens_index, "velocity_dispersion"] = safe_value(
-            self.deflector_velocity_dispersion()
-        )
-        df.loc[lens_index, "deflector_redshift"] = safe_value(self.deflector_redshift)
-        df.loc[lens_index, "point_source_redshift"] = safe_value(
-            self.source_redshift_list[0]
-        )
+        row["velocity_dispersion"] = safe_value(self.deflector_velocity_dispersion())
+        row["deflector_redshift"] = safe_value(self.deflector_redshift)
+        row["point_source_redshift"] = safe_value(self.source_redshift_list[0])
         ps_times = self.point_source_arrival_times()[0]
         num_images = len(ps_times)
         for i in range(num_images):
-            df.loc[lens_index, f"image_{i}_arrival_time"] = ps_times[i]
-        df.loc[lens_index, "num_ps_images"] = safe_value(num_images)
+            row[f"image_{i}_arrival_time"] = ps_times[i]
+        row["num_ps_images"] = safe_value(num_images)
 
         micro_lens_params = (
             self._microlensing_parameters_for_image_positions_single_source(
@@ -1474,17 +1464,37 @@ class Lens(LensedSystemBase):
                     param_for_all_images = param_for_all_images.flatten()
                 # if param_for_all_images.shape[0]
                 val = param_for_all_images[k]
-                df.loc[lens_index, pls] = safe_value(val)
+                row[pls] = safe_value(val)
 
         for i in range(num_images):
-            df.loc[lens_index, f"point_source_arrival_time_{i}"] = safe_value(
-                ps_times[i]
-            )
-        df.loc[lens_index, "external_shear"] = safe_value(self.external_shear)
-        df.loc[lens_index, "extended_unlensed_mag"] = safe_value(
+            row[f"point_source_arrival_time_{i}"] = safe_value(ps_times[i])
+        row["external_shear"] = safe_value(self.external_shear)
+        row["extended_unlensed_mag"] = safe_value(
             self.extended_source_magnitude("i", lensed=False)[0]
         )
-        df.loc[lens_index, "extended_magnification"] = safe_value(
+        row["extended_magnification"] = safe_value(
             self.extended_source_magnification[0]
         )
+        return row
+
+    def lens_to_dataframe(self, index=0, df=None):
+        """Store lens properties to a dataframe. See lens_to_dict() for the
+        stored properties. To store a full population, use
+        slsim.Lenses.lens_pop.lens_population_to_dataframe() which creates the
+        dataframe at once instead of row by row.
+
+        :param index: index of row that the lens is stored in. Default =
+            0
+        :type index: int
+        :param df: Optional. Stores lens into an existing df if
+            necessary, creates one if not. An existing df is modified in
+            place, whether the row at index already exists or not.
+        :return: pandas DataFrame containing deflector/source mass and
+            light properties.
+        """
+        row = self.lens_to_dict()
+        if df is None:
+            return pd.DataFrame([row], index=[index])
+        for key, val in row.items():
+            df.loc[index, key] = val
         return df
@@ -1,6 +1,9 @@
 import numpy as np
+import pandas as pd
+from multiprocessing import get_context
 
 from slsim.Lenses.lens import Lens
+from slsim.Util.param_util import validity_prefilter
 from typing import Optional
 from astropy.cosmology import Cosmology
 from slsim.Sources.SourcePopulation.source_pop_base import SourcePopBase
@@ -72,9 +75,6 @@ class LensPop(LensedPopulationBase):
             # This creates a single deflector - single_source lens.
             _source = self._sources.draw_source()
             _deflector = self._lens_galaxies.draw_deflector()
-            _los = self.los_pop.draw_los(
-                source_redshift=_source.redshift, deflector_redshift=_deflector.redshift
-            )
             if test_area is None:
                 theta_e_infinity = _deflector.theta_e_infinity(cosmo=self.cosmo)
                 test_area_ = area_theta_e_infinity(theta_e_infinity=theta_e_infinity)
@@ -85,6 +85,11 @@ class LensPop(LensedPopulationBase):
             _source.update_center(
                 area=test_area_, reference_position=_deflector.deflector_center
             )
+            if not _validity_prefilter(_deflector, _source, kwargs_lens_cut):
+                continue
+            _los = self.los_pop.draw_los(
+                source_redshift=_source.redshift, deflector_redshift=_deflector.redshift
+            )
             gg_lens = Lens(
                 deflector_class=_deflector,
                 source_class=_source,
@@ -139,6 +144,7 @@ class LensPop(LensedPopulationBase):
         kwargs_lens_cuts,
         multi_source=False,
         speed_factor=1,
+        n_processes=None,
     ):
         """Return full population list of all lenses within the area.
 
@@ -157,6 +163,13 @@ class LensPop(LensedPopulationBase):
             The default value is True.
         :param speed_factor: factor by which the number of deflectors is
             decreased to speed up the calculations.
+        :param n_processes: number of processes used to draw the lenses
+            in parallel. If None or 1, the lenses are drawn in the
+            current process. The parallel draw is reproducible for a
+            given seed of np.random, but consumes the random stream
+            differently than the serial draw, so the same seed gives
+            different populations for different n_processes.
+        :type n_processes: int or None
         :return: List of Lens instances with parameters of the
             deflectors and lens and source light.
         :rtype: list
@@ -172,60 +185,185 @@ class LensPop(LensedPopulationBase):
         #        print("num_sources is " + str(num_sources))
         #        print(np.int(num_lenses * num_sources_tested_mean))
 
+        parallel = n_processes is not None and n_processes > 1
+        if parallel:
+            # one seed per process, drawn before the deflectors as drawing these may
+            # consume a varying number of random numbers (properties cached in the
+            # deflector catalog are not drawn again)
+            seeds = np.random.randint(0, 2**31 - 1, size=n_processes)
+
         # Draw a population of galaxy-galaxy lenses within the area.
-        for _ in range(int(num_lenses / speed_factor)):
-            _deflector = self._lens_galaxies.draw_deflector()
-            _deflector.update_center(deflector_area=0.01)
-            theta_e_infinity = _deflector.theta_e_infinity(cosmo=self.cosmo)
-            test_area = area_theta_e_infinity(theta_e_infinity=theta_e_infinity)
-            num_sources_tested = self.get_num_sources_tested(
-                testarea=test_area * speed_factor
+        deflector_list = self._lens_galaxies.draw_deflectors(
+            int(num_lenses / speed_factor)
+        )
+        if not parallel or len(deflector_list) == 0:
+            for _deflector in deflector_list:
+                lens_final = self._draw_lens_for_deflector(
+                    _deflector, kwargs_lens_cuts, multi_source, speed_factor
+                )
+                if lens_final is not None:
+                    lens_population.append(lens_final)
+            return lens_population
+
+        # The deflectors are independent of each other, so the sources behind them
+        # can be drawn in parallel. The deflectors are split into one chunk per
+        # process, each with its own seed. Every chunk is drawn by a fresh process
+        # (maxtasksperchild=1) with its own copy of the populations, such that the
+        # result does not depend on how the chunks are scheduled and is
+        # reproducible for a given seed.
+        chunks = [
+            list(chunk)
+            for chunk in np.array_split(np.arange(len(deflector_list)), n_processes)
+            if len(chunk) > 0
+        ]
+        args = [
+            (
+                [deflector_list[i] for i in chunk],
+                seed,
+                kwargs_lens_cuts,
+                multi_source,
+                speed_factor,
             )
+            for chunk, seed in zip(chunks, seeds)
+        ]
+        with get_context("spawn").Pool(
+            len(chunks),
+            initializer=_init_lens_pop_worker,
+            initargs=(self,),
+            maxtasksperchild=1,
+        ) as pool:
+            results = pool.starmap(_draw_lenses_worker, args)
+        lens_population = [
+            lens for lenses in results for lens in lenses if lens is not None
+        ]
+        return lens_population
 
-            if num_sources_tested > 0:
-                valid_sources = []
-                n = 0
-                while n < num_sources_tested:
-                    _source = self._sources.draw_source()
-                    _source.update_center(
-                        area=test_area, reference_position=_deflector.deflector_center
-                    )
-                    if n == 0:
-                        # TODO: this is only consistent for a single source. If there
-                        # are multiple sources at different redshift, this is not fully
-                        # acurate
-                        los_class = self.los_pop.draw_los(
-                            source_redshift=_source.redshift,
-                            deflector_redshift=_deflector.redshift,
-                        )
-                    lens_class = Lens(
-                        deflector_class=_deflector,
-                        source_class=_source,
-                        cosmo=self.cosmo,
-                        los_class=los_class,
-                    )
-                    # Check the validity of the lens system
-                    if lens_class.validity_test(**kwargs_lens_cuts):
-                        valid_sources.append(_source)
-                        # If multi_source is False, stop after finding the first valid source
-                        if not multi_source:
-                            break
+    def _draw_lens_for_deflector(
+        self, deflector, kwargs_lens_cuts, multi_source, speed_factor
+    ):
+        """Draws the sources in the test area around a single deflector and
+        builds the lens with the valid sources.
+
+        :param deflector: Deflector instance
+        :param kwargs_lens_cuts: validity test keywords, see
+            draw_population()
+        :type kwargs_lens_cuts: dict
+        :param multi_source: If True, keeps all valid sources, otherwise
+            only the first one.
+        :param speed_factor: factor by which the number of deflectors is
+            decreased to speed up the calculations.
+        :return: Lens instance or None, if no valid source is found
+        """
+        deflector.update_center(deflector_area=0.01)
+        theta_e_infinity = deflector.theta_e_infinity(cosmo=self.cosmo)
+        test_area = area_theta_e_infinity(theta_e_infinity=theta_e_infinity)
+        num_sources_tested = self.get_num_sources_tested(
+            testarea=test_area * speed_factor
+        )
+
+        if num_sources_tested > 0:
+            valid_sources = []
+            los_class = None
+            n = 0
+            while n < num_sources_tested:
+                _source = self._sources.draw_source()
+                _source.update_center(
+                    area=test_area, reference_position=deflector.deflector_center
+                )
+                # Rejects pairs that can not be valid before constructing the Lens
+                if not _validity_prefilter(deflector, _source, kwargs_lens_cuts):
                     n += 1
-                if len(valid_sources) > 0:
-                    # Use a single source if only one source is valid, else use
-                    # the list of valid sources
-                    if len(valid_sources) == 1:
-                        final_sources = valid_sources[0]
-                    else:
-                        final_sources = valid_sources
-                    lens_final = Lens(
-                        deflector_class=_deflector,
-                        source_class=final_sources,
-                        cosmo=self.cosmo,
-                        los_class=los_class,
+                    continue
+                if los_class is None:
+                    # TODO: this is only consistent for a single source. If there
+                    # are multiple sources at different redshift, this is not fully
+                    # acurate
+                    los_class = self.los_pop.draw_los(
+                        source_redshift=_source.redshift,
+                        deflector_redshift=deflector.redshift,
                     )
-                    lens_population.append(lens_final)
-        return lens_population
+                lens_class = Lens(
+                    deflector_class=deflector,
+                    source_class=_source,
+                    cosmo=self.cosmo,
+                    los_class=los_class,
+                )
+                # Check the validity of the lens system
+                if lens_class.validity_test(**kwargs_lens_cuts):
+                    valid_sources.append(_source)
+                    # If multi_source is False, stop after finding the first valid source
+                    if not multi_source:
+                        break
+                n += 1
+            if len(valid_sources) > 0:
+                # Use a single source if only one source is valid, else use
+                # the list of valid sources
+                if len(valid_sources) == 1:
+                    final_sources = valid_sources[0]
+                else:
+                    final_sources = valid_sources
+                return Lens(
+                    deflector_class=deflector,
+                    source_class=final_sources,
+                    cosmo=self.cosmo,
+                    los_class=los_class,
+                )
+        return None
+
+
+# LensPop instance of a worker process, set once per worker by _init_lens_pop_worker()
+# such that the populations are not sent to the worker with every task
+_WORKER_LENS_POP = None
+
+
+def _init_lens_pop_worker(lens_pop):
+    """Initializer of the worker processes of LensPop.draw_population().
+
+    :param lens_pop: LensPop instance
+    :return: None
+    """
+    global _WORKER_LENS_POP
+    _WORKER_LENS_POP = lens_pop
+
+
+def _draw_lenses_worker(
+    deflector_list, seed, kwargs_lens_cuts, multi_source, speed_factor
+):
+    """Draws the lenses of a chunk of deflectors in a worker process, see
+    LensPop._draw_lens_for_deflector().
+
+    :param deflector_list: list of Deflector instances
+    :param seed: seed of the numpy random state used for this chunk
+    :type seed: int
+    :return: list of Lens instances or None, if no valid source is found
+        for a deflector
+    """
+    np.random.seed(seed)
+    return [
+        _WORKER_LENS_POP._draw_lens_for_deflector(
+            deflector, kwargs_lens_cuts, multi_source, speed_factor
+        )
+        for deflector in deflector_list
+    ]
+
+
+def _validity_prefilter(deflector, source, kwargs_lens_cuts):
+    """Checks the necessary conditions of Lens.validity_test() that do not
+    require constructing the Lens, see param_util.validity_prefilter().
+
+    :param deflector: Deflector instance
+    :param source: Source instance
+    :param kwargs_lens_cuts: validity test keywords
+    :type kwargs_lens_cuts: dict
+    :return: False if the pair can not pass the validity test
+    """
+    return validity_prefilter(
+        z_lens=deflector.redshift,
+        z_source=source.redshift,
+        center_lens=deflector.deflector_center,
+        center_source=source.point_source_position,
+        max_image_separation=kwargs_lens_cuts.get("max_image_separation", 10),
+    )
 
 
 def area_theta_e_infinity(theta_e_infinity):
@@ -237,3 +375,19 @@ def area_theta_e_infinity(theta_e_infinity):
     """
     test_area = np.pi * (theta_e_infinity * 1.5) ** 2
     return test_area
+
+
+def lens_population_to_dataframe(lens_population):
+    """Stores the properties of a full lens population in a dataframe. The
+    properties of all lenses are first collected and the dataframe is then
+    built column-wise at once, which is much faster than filling it row by row
+    for large populations.
+
+    :param lens_population: list of Lens instances, e.g. from
+        LensPop.draw_population()
+    :type lens_population: list
+    :return: pandas DataFrame with one row per lens containing
+        deflector/source mass and light properties, see
+        Lens.lens_to_dict()
+    """
+    return pd.DataFrame([lens.lens_to_dict() for lens in lens_population])
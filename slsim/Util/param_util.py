@@ -5,14 +5,19 @@ from scipy.signal import fftconvolve
 from lenstronomy.Util.param_util import transform_e1e2_product_average
 from lenstronomy.Util.param_util import ellipticity2phi_q
 from lenstronomy.LightModel.light_model import LightModel
-from lenstronomy.Util import data_util
 from astropy.io import fits
 from astropy import units as u
 from astropy.stats import sigma_clipped_stats
 from astropy.convolution import Gaussian2DKernel
 import warnings
+import atexit
+import os
+import pickle
 from astropy.cosmology import default_cosmology
 
+# Optional pyFFTW backend used in convolved_image(), see use_pyfftw()
+_FFT_BACKEND = None
+
 
 def draw_coord_in_circle(area, size=1):
     """Draw realizations of points in circle.
@@ -135,6 +140,9 @@ def convolved_image(image, psf_kernel, convolution_type="fft"):
     :returns: convolved image.
     """
     if convolution_type == "fft":
+        if _FFT_BACKEND is not None:
+            with scipy.fft.set_backend(_FFT_BACKEND):
+                return fftconvolve(image, psf_kernel, mode="same")
         return fftconvolve(image, psf_kernel, mode="same")
     if convolution_type == "grid":
         return convolve2d(
@@ -142,6 +150,64 @@ def convolved_image(image, psf_kernel, convolution_type="fft"):
         )
 
 
+def use_pyfftw(
+    wisdom_file="~/.slsim_fftw_wisdom", planner_effort="FFTW_MEASURE", enable=True
+):
+    """Uses pyFFTW as FFT backend for the fft convolutions in
+    convolved_image(). FFTW plans are measured once per image shape and stored
+    as wisdom in a file, such that repeated convolutions with the same shapes
+    (also in later sessions) reuse the optimized plans.
+
+    :param wisdom_file: path to the file from which the FFTW wisdom is
+        loaded and to which it is saved when the interpreter exits. If
+        None, wisdom is not persisted.
+    :type wisdom_file: str or None
+    :param planner_effort: FFTW planner effort, e.g. "FFTW_ESTIMATE" or
+        "FFTW_MEASURE"
+    :type planner_effort: str
+    :param enable: if False, falls back to the default scipy FFT backend
+        and no wisdom is saved at exit.
+    :type enable: bool
+    :return: None
+    """
+    global _FFT_BACKEND
+    if not enable:
+        _FFT_BACKEND = None
+        atexit.unregister(_export_fftw_wisdom)
+        return
+    try:
+        import pyfftw
+        import pyfftw.interfaces.scipy_fft
+    except ImportError:
+        raise ImportError(
+            "The pyfftw package is not installed. Please install it using 'pip install pyfftw'."
+        )
+    pyfftw.config.PLANNER_EFFORT = planner_effort
+    # keep the FFTW objects alive between calls to avoid re-planning
+    pyfftw.interfaces.cache.enable()
+    if wisdom_file is not None:
+        wisdom_file = os.path.expanduser(wisdom_file)
+        if os.path.exists(wisdom_file):
+            with open(wisdom_file, "rb") as f:
+                pyfftw.import_wisdom(pickle.load(f))
+        atexit.unregister(_export_fftw_wisdom)
+        atexit.register(_export_fftw_wisdom, wisdom_file)
+    _FFT_BACKEND = pyfftw.interfaces.scipy_fft
+
+
+def _export_fftw_wisdom(wisdom_file):
+    """Saves the accumulated FFTW wisdom to a file.
+
+    :param wisdom_file: path to the file in which the wisdom is stored
+    :type wisdom_file: str
+    :return: None
+    """
+    import pyfftw
+
+    with open(wisdom_file, "wb") as f:
+        pickle.dump(pyfftw.export_wisdom(), f)
+
+
 def magnitude_to_amplitude(magnitude, mag_zero_point):
     """Converts source magnitude to amplitude.
 
@@ -732,28 +798,37 @@ def surface_brightness_reff(angular_size, source_model_list, kwargs_extended_sou
     :param angular_size: effective radius of an extended source in
         arcsec. For double sersic profile, user can use mean angular
         size of two component of the douuble sersic profile.
-    :param source_model_list: list of source light models
+    :param source_model_list: list of source light models. Only used to
+        integrate the components given with 'amp' instead of
+        'magnitude'.
     :param kwargs_extended_source: dictionary of keywords for the source
         light model(s). Kewords used are in lenstronomy conventions.
+        Each component needs either a 'magnitude' or an 'amp' keyword.
     :return: average surface brightness within half light radius
         [mag/arcsec^2]
     """
-    # TODO this definition only works when source position is given
     _mag_zero_dummy = 0  # from mag to amp conversion we need a dummy mag zero point.
     # Irrelevant for this routine.
-    source_models_list = source_model_list
-    # TODO: remove unnecessary dependencies on center_lens and draw_area from this class
-    kwargs_extended_source = kwargs_extended_source
-
-    lightModel = LightModel(light_model_list=source_models_list)
-
-    kwargs_extended_source_amp = data_util.magnitude2amplitude(
-        lightModel, kwargs_extended_source, magnitude_zero_point=0
-    )
-
-    total_flux = np.sum(
-        lightModel.total_flux(kwargs_extended_source_amp)
-    )  # integrated flux
+    # The amplitude of a light profile given with a magnitude is normalized such that
+    # its integrated flux matches the magnitude, so its flux does not require
+    # integrating the light profile. Only components given with an amplitude are
+    # integrated.
+    total_flux = 0  # integrated flux
+    light_model = None
+    for k, kwargs in enumerate(kwargs_extended_source):
+        if "magnitude" in kwargs:
+            total_flux += magnitude_to_amplitude(
+                kwargs["magnitude"], mag_zero_point=_mag_zero_dummy
+            )
+        elif "amp" in kwargs:
+            if light_model is None:
+                light_model = LightModel(light_model_list=source_model_list)
+            total_flux += light_model.total_flux(kwargs_extended_source, k=k)[0]
+        else:
+            raise ValueError(
+                "Each extended source component needs either a 'magnitude' or an "
+                "'amp' keyword, component %s has neither." % k
+            )
     area = angular_size**2 * np.pi
     surface_brightness_amp = (
         total_flux / 2 / area
@@ -814,6 +889,65 @@ def update_cosmology_in_yaml_file(cosmo, yml_file):
     return yml_file.replace(old_cosmo, new_cosmo)
 
 
+def einstein_radius_validity(
+    einstein_radius,
+    center_lens,
+    center_source,
+    min_image_separation=0,
+    max_image_separation=10,
+):
+    """Checks whether a lens-source configuration can produce strongly lensed
+    images with an acceptable separation, based on the Einstein radius and the
+    lens and source positions only. The check is done on plain floats, as it is
+    evaluated for every lens-source pair tested when drawing a population.
+
+    :param einstein_radius: Einstein radius of the lens-source pair in
+        arc-seconds
+    :param center_lens: [x, y] position of the lens center in arc-
+        seconds
+    :param center_source: [x, y] position of the source in arc-seconds
+    :param min_image_separation: minimum image separation in arc-seconds
+    :param max_image_separation: maximum image separation in arc-seconds
+    :return: True if twice the Einstein radius lies within the image
+        separation limits and the source lies within sqrt(2) times the
+        Einstein radius from the lens center, False otherwise
+    """
+    einstein_radius = float(einstein_radius)
+    if not min_image_separation <= 2 * einstein_radius <= max_image_separation:
+        return False
+    dx = float(center_lens[0]) - float(center_source[0])
+    dy = float(center_lens[1]) - float(center_source[1])
+    return dx * dx + dy * dy <= 2 * einstein_radius * einstein_radius
+
+
+def validity_prefilter(
+    z_lens, z_source, center_lens, center_source, max_image_separation=10
+):
+    """Cheap necessary conditions of the lens validity test, which can be
+    evaluated from the deflector and source properties before a Lens is
+    constructed and its Einstein radius is computed. Pairs failing it can not
+    pass the full validity test.
+
+    :param z_lens: deflector redshift
+    :param z_source: source redshift
+    :param center_lens: [x, y] position of the lens center in arc-
+        seconds
+    :param center_source: [x, y] position of the source in arc-seconds
+    :param max_image_separation: maximum image separation in arc-seconds
+    :return: False if the source is not behind the deflector or too far
+        from the deflector center to be multiply imaged with a
+        separation below max_image_separation, True otherwise
+    """
+    if z_lens >= z_source:
+        return False
+    # the source has to lie within sqrt(2) times the Einstein radius, which itself
+    # is at most half of the maximum image separation, see
+    # einstein_radius_validity()
+    dx = float(center_lens[0]) - float(center_source[0])
+    dy = float(center_lens[1]) - float(center_source[1])
+    return 2 * (dx * dx + dy * dy) <= max_image_separation * max_image_separation
+
+
 def image_separation_from_positions(image_positions):
     """Calculate image separation in arc-seconds; if there are only two images,
     the separation between them is returned; if there are more than 2 images,
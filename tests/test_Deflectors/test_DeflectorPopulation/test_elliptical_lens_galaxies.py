@@ -6,6 +6,7 @@ from slsim.Util.param_util import vel_disp_from_m_star
 from slsim.Pipelines.skypy_pipeline import SkyPyPipeline
 from astropy.units import Quantity
 import copy
+import numpy as np
 import pytest
 
 
@@ -43,6 +44,33 @@ def test_deflector_number_draw_deflector(elliptical_lens_galaxies):
     assert num_deflectors >= 0
 
 
+def test_draw_deflectors(elliptical_lens_galaxies):
+    galaxy_pop = elliptical_lens_galaxies
+    deflector_list = galaxy_pop.draw_deflectors(5)
+    assert len(deflector_list) == 5
+    assert all(deflector.redshift != 0 for deflector in deflector_list)
+    assert galaxy_pop.draw_deflectors(0) == []
+    deflector = galaxy_pop.draw_deflector(index=0)
+    assert deflector.redshift == galaxy_pop._galaxy_select["z"][0]
+
+
+def test_draw_deflectors_indices(elliptical_lens_galaxies, monkeypatch):
+    # every deflector, including the last one, can be drawn
+    galaxy_pop = elliptical_lens_galaxies
+    monkeypatch.setattr(galaxy_pop, "_galaxy_select", galaxy_pop._galaxy_select[:3])
+    monkeypatch.setattr(galaxy_pop, "_num_select", 3)
+    redshifts = list(galaxy_pop._galaxy_select["z"])
+    np.random.seed(1)
+    indices = [redshifts.index(galaxy_pop.draw_deflector().redshift) for _ in range(60)]
+    assert set(indices) == {0, 1, 2}
+
+    monkeypatch.setattr(galaxy_pop, "deflector_number", lambda: 3)
+    monkeypatch.setattr(galaxy_pop, "draw_deflector", lambda index=None: index)
+    np.random.seed(1)
+    indices = galaxy_pop.draw_deflectors(300)
+    assert set(indices) == {0, 1, 2}
+
+
 def test_vel_disp_from_m_star():
     assert vel_disp_from_m_star(0) == 0
 
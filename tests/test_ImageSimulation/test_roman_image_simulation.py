@@ -1,9 +1,19 @@
 import astropy.cosmology
+import datetime
 import numpy as np
 from slsim.Lenses.lens import Lens
 from slsim.ImageSimulation.roman_image_simulation import (
     simulate_roman_image,
+    RomanImageSimulator,
+    simulate_roman_image_batch,
     lens_image_roman,
+    add_roman_background,
+    get_bandpass,
+    get_psf,
+    _get_wcs_dict,
+    _get_wcs_for_detector,
+    _get_background_template,
+    _load_psf_kernel,
 )
 from slsim.ImageSimulation.image_simulation import simulate_image
 from slsim.Sources.source import Source
@@ -12,6 +22,9 @@ from slsim.LOS.los_individual import LOSIndividual
 import os
 import pickle
 import pytest
+import shutil
+import subprocess
+import sys
 
 COSMO = astropy.cosmology.default_cosmology.get()
 
@@ -153,6 +166,132 @@ def test_simulate_roman_image_with_psf_without_noise():
     )
 
 
+def test_roman_image_simulator():
+    simulator = RomanImageSimulator(
+        band=BAND,
+        num_pix=45,
+        oversample=3,
+        add_noise=False,
+        psf_directory=PSF_DIRECTORY,
+    )
+    image_1 = simulator.simulate(LENS)
+    image_2 = simulator.simulate(SNIa_Lens)
+    image_3 = simulator.simulate(LENS)
+    image_ref = simulate_roman_image(
+        lens_class=LENS,
+        band=BAND,
+        num_pix=45,
+        oversample=3,
+        add_noise=False,
+        psf_directory=PSF_DIRECTORY,
+    )
+    assert image_1.shape == (45, 45)
+    assert image_2.shape == (45, 45)
+    np.testing.assert_allclose(image_1, image_ref)
+    np.testing.assert_allclose(image_3, image_ref)
+
+    # single precision intermediate arrays agree with double precision
+    simulator_single = RomanImageSimulator(
+        band=BAND,
+        num_pix=45,
+        oversample=3,
+        add_noise=False,
+        psf_directory=PSF_DIRECTORY,
+        precision="single",
+    )
+    image_single = simulator_single.simulate(LENS)
+    np.testing.assert_allclose(image_single, image_1, rtol=1e-5, atol=0)
+    with pytest.raises(ValueError):
+        RomanImageSimulator(
+            band=BAND, num_pix=45, psf_directory=PSF_DIRECTORY, precision="half"
+        )
+
+    simulator_noise = RomanImageSimulator(
+        band=BAND, num_pix=45, oversample=3, psf_directory=PSF_DIRECTORY
+    )
+    image_noise_1 = simulator_noise.simulate(LENS, seed=42)
+    image_noise_2 = simulator_noise.simulate(LENS, seed=42)
+    np.testing.assert_allclose(image_noise_1, image_noise_2)
+    # the random number generator is reused, and continued without a seed
+    rng = simulator_noise._rng
+    image_noise_3 = simulator_noise.simulate(LENS)
+    image_noise_4 = simulator_noise.simulate(LENS)
+    assert simulator_noise._rng is rng
+    assert not np.all(image_noise_3 == image_noise_4)
+    image_noise_5 = simulator_noise.simulate(LENS, seed=42)
+    np.testing.assert_allclose(image_noise_5, image_noise_1)
+
+
+def test_roman_image_simulator_fft_convolution():
+    with open(
+        os.path.join(PSF_DIRECTORY, "F106_SCA01_2000_2000_3.pkl"), "rb"
+    ) as psf_file:
+        psf = pickle.load(psf_file)
+    simulator = RomanImageSimulator(
+        band=BAND,
+        num_pix=45,
+        oversample=3,
+        add_noise=False,
+        psf_directory=PSF_DIRECTORY,
+        fft_convolution=True,
+    )
+    assert simulator._psf_k is not None
+    image = simulator.simulate(LENS)
+
+    # the galsim convolution is the default, the psf fft is then not computed
+    simulator_galsim = RomanImageSimulator(
+        band=BAND, num_pix=45, oversample=3, psf_directory=PSF_DIRECTORY
+    )
+    assert simulator_galsim._psf_k is None
+
+    # the fft convolution is the supersampled convolution with the full psf kernel
+    kwargs_psf = {
+        "point_source_supersampling_factor": 3,
+        "psf_type": "PIXEL",
+        "kernel_point_source": psf[0].data,
+        "kernel_point_source_normalisation": False,
+    }
+    kwargs_numerics = {
+        "point_source_supersampling_factor": 3,
+        "supersampling_factor": 3,
+        "supersampling_convolution": True,
+        "supersampling_kernel_size": psf[0].data.shape[0],
+    }
+    image_ref = simulate_image(
+        lens_class=LENS,
+        band=BAND,
+        num_pix=51,
+        observatory="Roman",
+        kwargs_psf=kwargs_psf,
+        kwargs_numerics=kwargs_numerics,
+        add_noise=False,
+    )[3:-3, 3:-3]
+    np.testing.assert_allclose(image, image_ref, rtol=1e-5, atol=0)
+
+
+def test_simulate_roman_image_batch():
+    kwargs_simulator = {
+        "oversample": 3,
+        "add_noise": False,
+        "psf_directory": PSF_DIRECTORY,
+    }
+    images = simulate_roman_image_batch(
+        [LENS, SNIa_Lens, LENS],
+        band=BAND,
+        num_pix=45,
+        n_processes=2,
+        **kwargs_simulator,
+    )
+    simulator = RomanImageSimulator(band=BAND, num_pix=45, **kwargs_simulator)
+    assert len(images) == 3
+    np.testing.assert_allclose(images[0], simulator.simulate(LENS))
+    np.testing.assert_allclose(images[1], simulator.simulate(SNIa_Lens))
+    np.testing.assert_allclose(images[2], images[0])
+
+    with pytest.raises(ValueError):
+        simulate_roman_image_batch([LENS], band=BAND, num_pix=45, seeds=[1, 2])
+
+
 def test_lens_image_roman():
     lens_image = lens_image_roman(
         lens_class=SNIa_Lens,
@@ -188,5 +327,159 @@ def test_lens_image_roman():
     assert 1 < np.mean(noise) < 1.8
 
 
+def test_get_psf():
+    psf = get_psf(BAND, 1, (2000, 2000), 3, PSF_DIRECTORY)
+    assert get_psf(BAND, 1, [2000, 2000], 3, PSF_DIRECTORY) is psf
+
+    psf_from_array = get_psf(
+        BAND, 1, (2000, 2000), 3, PSF_DIRECTORY, psf_array=psf.image.array
+    )
+    assert psf_from_array is not psf
+    np.testing.assert_allclose(psf_from_array.image.array, psf.image.array)
+
+    final_image = simulate_roman_image(
+        lens_class=LENS,
+        band=BAND,
+        num_pix=45,
+        oversample=3,
+        add_noise=False,
+        psf_array=psf.image.array,
+    )
+    final_image_ref = simulate_roman_image(
+        lens_class=LENS,
+        band=BAND,
+        num_pix=45,
+        oversample=3,
+        add_noise=False,
+        psf_directory=PSF_DIRECTORY,
+    )
+    np.testing.assert_allclose(final_image, final_image_ref)
+
+
+def test_load_psf_kernel(tmp_path):
+    psf_file_path = os.path.join(tmp_path, "F106_SCA01_2000_2000_3.pkl")
+    shutil.copy(os.path.join(PSF_DIRECTORY, "F106_SCA01_2000_2000_3.pkl"), tmp_path)
+    with open(psf_file_path, "rb") as psf_file:
+        psf_kernel_ref = pickle.load(psf_file)[0].data
+
+    # the first load reads the pickle file and stores the kernel as .npy file
+    psf_kernel = _load_psf_kernel(psf_file_path)
+    np.testing.assert_array_equal(psf_kernel, psf_kernel_ref)
+    assert os.path.exists(os.path.join(tmp_path, "F106_SCA01_2000_2000_3.npy"))
+
+    # subsequent loads memory-map the .npy file
+    psf_kernel_mmap = _load_psf_kernel(psf_file_path)
+    assert isinstance(psf_kernel_mmap, np.memmap)
+    np.testing.assert_array_equal(psf_kernel_mmap, psf_kernel_ref)
+
+    psf = get_psf(BAND, 1, (2000, 2000), 3, str(tmp_path))
+    psf_ref = get_psf(BAND, 1, (2000, 2000), 3, PSF_DIRECTORY)
+    np.testing.assert_allclose(psf.image.array, psf_ref.image.array)
+
+
+def test_get_wcs_for_detector():
+    date = datetime.datetime(year=2027, month=7, day=7)
+    wcs = _get_wcs_for_detector(30, -30, date, 1)
+    hits = _get_wcs_dict.cache_info().hits
+    wcs_2 = _get_wcs_for_detector(30, -30, date, 2)
+    assert _get_wcs_dict.cache_info().hits == hits + 1
+    assert wcs is _get_wcs_dict(30, -30, date)[1]
+    assert wcs_2 is not wcs
+
+    # the pointing matches the one obtained from the sexagesimal coordinates
+    import galsim
+    from galsim import roman
+
+    ra, dec = 31.2345678, -25.98765
+    targ_pos = galsim.CelestialCoord(
+        ra=galsim.Angle.from_hms("02h04m56.296272s"),
+        dec=galsim.Angle.from_dms("-25d59m15.54s"),
+    )
+    wcs_ref = roman.getWCS(world_pos=targ_pos, date=date)[1]
+    pos = galsim.PositionD(2044, 2044)
+    separation = (
+        _get_wcs_for_detector(ra, dec, date, 1)
+        .toWorld(pos)
+        .distanceTo(wcs_ref.toWorld(pos))
+    )
+    assert separation.deg * 3600 < 1e-6
+
+
+def test_add_roman_background():
+    import galsim
+
+    date = datetime.datetime(year=2027, month=7, day=7)
+    array = np.full((20, 20), 0.3, dtype=np.float32)
+    image = galsim.ImageF(array.copy())
+    image_bkg = add_roman_background(image, BAND, 1, 20, 146, 30, -30, date)
+    np.testing.assert_array_equal(image_bkg.array, np.round(image_bkg.array))
+    # the background is added in place
+    assert image_bkg is image
+
+    image_bkg_float = add_roman_background(
+        galsim.ImageF(array.copy()),
+        BAND,
+        1,
+        20,
+        146,
+        30,
+        -30,
+        date,
+        quantize=False,
+    )
+    assert not np.all(image_bkg_float.array == np.round(image_bkg_float.array))
+    np.testing.assert_allclose(
+        image_bkg_float.array, image_bkg.array, rtol=0, atol=0.5 + 1e-4
+    )
+    # the background is drawn once and then taken from the cache
+    hits = _get_background_template.cache_info().hits
+    image_bkg_float_2 = add_roman_background(
+        galsim.ImageF(array.copy()),
+        BAND,
+        1,
+        20,
+        146,
+        30,
+        -30,
+        date,
+        quantize=False,
+    )
+    assert _get_background_template.cache_info().hits == hits + 1
+    np.testing.assert_allclose(image_bkg_float_2.array, image_bkg_float.array)
+    background = _get_background_template(BAND, 1, 30, -30, date, 20, 146)
+    assert not background.flags.writeable
+
+
+def test_lazy_imports():
+    # galsim and stpsf are only imported once the Roman simulation is used
+    code = (
+        "import sys\n"
+        "import slsim.ImageSimulation.roman_image_simulation as roman_sim\n"
+        "assert 'stpsf' not in sys.modules\n"
+        "assert 'galsim' not in sys.modules and roman_sim.galsim is None\n"
+        "roman_sim._import_galsim()\n"
+        "assert roman_sim.roman is sys.modules['galsim.roman']\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_get_bandpass():
+    bandpass = get_bandpass("f106")
+    assert bandpass is get_bandpass(BAND)
+    assert bandpass.name == "Y106"
+    assert get_bandpass("F146").name == "W146"
+
+
+def test_get_band_info_missing_band(monkeypatch):
+    # a band missing in galsim only fails for that band
+    from slsim.ImageSimulation import roman_image_simulation
+
+    monkeypatch.setattr(roman_image_simulation, "_BAND_INFO", {})
+    monkeypatch.setitem(roman_image_simulation._BANDPASS_KEYS, "F146", "W149")
+    with pytest.raises(KeyError):
+        get_bandpass("F146")
+    assert get_bandpass("F106").name == "Y106"
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -511,6 +511,33 @@ def test_lens_to_dataframe(pes_lens_instance):
 
     lens_df = pes_lens_instance.lens_to_dataframe()
     assert isinstance(lens_df, pd.DataFrame)
+    lens_dict = pes_lens_instance.lens_to_dict()
+    assert list(lens_df.columns) == list(lens_dict.keys())
+
+    lens_df = pes_lens_instance.lens_to_dataframe(index=1, df=lens_df)
+    lens_df = pes_lens_instance.lens_to_dataframe(index=1, df=lens_df)
+    assert list(lens_df.index) == [0, 1]
+
+    # an existing dataframe is filled in place, for new and existing rows
+    df = pd.DataFrame()
+    df_returned = pes_lens_instance.lens_to_dataframe(index=0, df=df)
+    assert df_returned is df
+    pes_lens_instance.lens_to_dataframe(index=1, df=df)
+    pes_lens_instance.lens_to_dataframe(index=1, df=df)
+    assert list(df.index) == [0, 1]
+    assert list(df.columns) == list(lens_dict.keys())
+    npt.assert_almost_equal(
+        df["deflector_redshift"].values, lens_df["deflector_redshift"].values
+    )
+
+    from slsim.Lenses.lens_pop import lens_population_to_dataframe
+
+    pop_df = lens_population_to_dataframe([pes_lens_instance, pes_lens_instance])
+    assert list(pop_df.columns) == list(lens_dict.keys())
+    assert len(pop_df) == 2
+    npt.assert_almost_equal(
+        pop_df["deflector_redshift"].values, lens_df["deflector_redshift"].values
+    )
 
 
 ################################################
@@ -673,7 +700,7 @@ def test_microlensing_parameters_for_image_positions_single_source(
         pytest.skip("Skipping test: No lensed images found for this configuration.")
 
     try:
-        (kappa_star_img, kappa_tot_img, shear_img, shear_angle_img) = (
+        kappa_star_img, kappa_tot_img, shear_img, shear_angle_img = (
             lens_instance_with_variability._microlensing_parameters_for_image_positions_single_source(
                 band_i, source_index=0
             )
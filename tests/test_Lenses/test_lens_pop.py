@@ -74,6 +74,43 @@ def test_draw_population(gg_lens_pop_instance):
     assert len(lens_population2) <= 40
 
 
+def test_select_lens_at_random_prefilter(gg_lens_pop_instance, monkeypatch):
+    # no line of sight is drawn for pairs rejected by the prefilter
+    lens_pop = gg_lens_pop_instance
+    redshifts = []
+    draw_los = lens_pop.los_pop.draw_los
+
+    def draw_los_recorded(source_redshift, deflector_redshift):
+        redshifts.append((source_redshift, deflector_redshift))
+        return draw_los(
+            source_redshift=source_redshift, deflector_redshift=deflector_redshift
+        )
+
+    monkeypatch.setattr(lens_pop.los_pop, "draw_los", draw_los_recorded)
+    np.random.seed(1)
+    lens = lens_pop.select_lens_at_random()
+    assert isinstance(lens, Lens)
+    assert len(redshifts) > 0
+    for z_source, z_lens in redshifts:
+        assert z_source > z_lens
+
+
+def test_draw_population_parallel(gg_lens_pop_instance):
+    lens_pop = gg_lens_pop_instance
+    kwargs_lens_cuts = {}
+    np.random.seed(42)
+    lens_population = lens_pop.draw_population(kwargs_lens_cuts, n_processes=2)
+    np.random.seed(42)
+    lens_population2 = lens_pop.draw_population(kwargs_lens_cuts, n_processes=2)
+    assert 0 < len(lens_population) <= 40
+    assert len(lens_population) == len(lens_population2)
+    for lens, lens2 in zip(lens_population, lens_population2):
+        assert isinstance(lens, Lens)
+        assert lens.generate_id() == lens2.generate_id()
+        assert lens.deflector_redshift == lens2.deflector_redshift
+        assert lens.source(0).redshift == lens2.source(0).redshift
+
+
 def test_pes_lens_pop_instance():
     cosmo = FlatLambdaCDM(H0=70, Om0=0.3)
 
@@ -6,6 +6,9 @@ from slsim.Util.param_util import (
     e2epsilon,
     random_ra_dec,
     convolved_image,
+    use_pyfftw,
+    einstein_radius_validity,
+    validity_prefilter,
     interpolate_variability,
     images_to_pixels,
     pixels_to_images,
@@ -39,6 +42,8 @@ from astropy.cosmology import Planck18 as cosmo
 from astropy.cosmology import FlatLambdaCDM, default_cosmology
 import tempfile
 import pytest
+from lenstronomy.LightModel.light_model import LightModel
+from lenstronomy.Util import data_util
 
 
 def test_draw_coord_in_circle():
@@ -77,6 +82,28 @@ def test_convolved_image():
     assert c_image_1.shape[0] == 101
 
 
+def test_use_pyfftw(tmp_path):
+    pytest.importorskip("pyfftw")
+    from slsim.Util.param_util import _export_fftw_wisdom
+
+    path = os.path.dirname(__file__)
+    image = np.load(os.path.join(path, "../TestData/image.npy"))
+    psf = np.load(os.path.join(path, "../TestData/psf_kernels_for_deflector.npy"))
+    c_image = convolved_image(image, psf)
+
+    wisdom_file = str(tmp_path / "fftw_wisdom")
+    use_pyfftw(wisdom_file=wisdom_file, planner_effort="FFTW_ESTIMATE")
+    try:
+        c_image_fftw = convolved_image(image, psf)
+        _export_fftw_wisdom(wisdom_file)
+        assert os.path.exists(wisdom_file)
+        # loads the wisdom back in
+        use_pyfftw(wisdom_file=wisdom_file, planner_effort="FFTW_ESTIMATE")
+    finally:
+        use_pyfftw(enable=False)
+    npt.assert_allclose(c_image_fftw, c_image, rtol=1e-6, atol=1e-10)
+
+
 def test_images_to_pixels():
     image = np.reshape(np.linspace(1, 27, 27), (3, 3, 3))
     ordered_pixels = images_to_pixels(image)
@@ -537,6 +564,46 @@ def test_surface_brightness_reff():
     )
     npt.assert_almost_equal(mag_arcsec2, 16.995, decimal=2)
 
+    # total flux of multiple components matches the integrated light profiles
+    kwargs_source_double = [
+        dict(kwargs_source[0]),
+        dict(kwargs_source[0], magnitude=16, R_sersic=0.3, n_sersic=4.0),
+    ]
+    source_model_list_double = ["SERSIC_ELLIPSE", "SERSIC_ELLIPSE"]
+    mag_arcsec2_double = surface_brightness_reff(
+        angular_size=angular_size,
+        source_model_list=source_model_list_double,
+        kwargs_extended_source=kwargs_source_double,
+    )
+    light_model = LightModel(light_model_list=source_model_list_double)
+    kwargs_amp = data_util.magnitude2amplitude(
+        light_model, kwargs_source_double, magnitude_zero_point=0
+    )
+    total_flux = np.sum(light_model.total_flux(kwargs_amp))
+    npt.assert_almost_equal(
+        mag_arcsec2_double,
+        amplitude_to_magnitude(total_flux / 2 / np.pi, mag_zero_point=0),
+        decimal=8,
+    )
+
+    # components given with an amplitude instead of a magnitude are integrated
+    kwargs_source_amp = [
+        dict(kwargs_source_double[0]),
+        {key: value for key, value in kwargs_amp[1].items() if key != "magnitude"},
+    ]
+    mag_arcsec2_amp = surface_brightness_reff(
+        angular_size=angular_size,
+        source_model_list=source_model_list_double,
+        kwargs_extended_source=kwargs_source_amp,
+    )
+    npt.assert_almost_equal(mag_arcsec2_amp, mag_arcsec2_double, decimal=8)
+    with pytest.raises(ValueError):
+        surface_brightness_reff(
+            angular_size=angular_size,
+            source_model_list=source_model_list,
+            kwargs_extended_source=[{"R_sersic": 1, "n_sersic": 1.0}],
+        )
+
 
 def test_gaussian_psf():
     psf_kernel = gaussian_psf(fwhm=0.9, delta_pix=0.2, num_pix=21)
@@ -569,5 +636,29 @@ def test_update_cosmology_in_yaml_file():
     assert "Tcmb0:" in updated_yaml
 
 
+def test_einstein_radius_validity():
+    assert einstein_radius_validity(1, [0, 0], np.array([0.5, 0.5]))
+    # source too far from the lens center
+    assert not einstein_radius_validity(1, np.array([0, 0]), [1.5, 0])
+    # Einstein radius outside of image separation range
+    assert not einstein_radius_validity(1, [0, 0], [0, 0], min_image_separation=3)
+    assert not einstein_radius_validity(1, [0, 0], [0, 0], max_image_separation=1)
+
+
+def test_validity_prefilter():
+    assert validity_prefilter(0.5, 1, [0, 0], np.array([0.5, 0.5]))
+    # source in front of the deflector
+    assert not validity_prefilter(1, 0.5, [0, 0], [0.5, 0.5])
+    assert not validity_prefilter(1, 1, [0, 0], [0.5, 0.5])
+    # source too far to be lensed with an image separation below the maximum
+    assert not validity_prefilter(0.5, 1, [0, 0], [3, 3], max_image_separation=5)
+    assert validity_prefilter(0.5, 1, [0, 0], [3, 3], max_image_separation=10)
+    # the prefilter never rejects configurations passing the Einstein radius test
+    for einstein_radius in [0.5, 1, 2.5, 5]:
+        center_source = [einstein_radius, einstein_radius]
+        if einstein_radius_validity(einstein_radius, [0, 0], center_source):
+            assert validity_prefilter(0.5, 1, [0, 0], center_source)
+
+
 if __name__ == "__main__":
     pytest.main()